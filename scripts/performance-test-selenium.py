@@ -4,38 +4,171 @@ Supports multiple browsers and comprehensive testing scenarios
 """
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.common.exceptions import TimeoutException, WebDriverException
 import time
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin, urlparse
 import json
 import concurrent.futures
+import threading
+import queue
 from datetime import datetime
 import statistics
+import itertools
+import bisect
+import math
+import random
+import atexit
+import shutil
+import socket
+import subprocess
+import tempfile
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Concurrent link checks allowed against a single host, to stay under anti-abuse limits
+LINK_CHECKS_PER_HOST = 2
+LINK_CHECK_USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+
+# Score penalties by band: a value above LOAD_TIME_THRESHOLDS[i] (seconds) costs
+# LOAD_TIME_PENALTIES[i + 1], a mobile score below MOBILE_SCORE_THRESHOLDS[i]
+# costs MOBILE_SCORE_PENALTIES[i]
+LOAD_TIME_THRESHOLDS = [1, 2, 3, 5]
+LOAD_TIME_PENALTIES = [0, 5, 10, 15, 25]
+MOBILE_SCORE_THRESHOLDS = [70, 85]
+MOBILE_SCORE_PENALTIES = [20, 10, 0]
+
+# Resources dropped in resource-blocking mode, leaving HTML and JS to isolate
+# server response and script execution time from asset download noise
+BLOCKED_RESOURCE_PATTERNS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.woff', '*.woff2', '*.ttf', '*.css']
+
+# Executable names tried, in order, when launching a shared Chrome process
+CHROME_BINARIES = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']
+
+# Response times kept for percentile estimates during a load test
+RESPONSE_TIME_RESERVOIR_SIZE = 10_000
+
+class LoadTestStats:
+    """Constant-memory accumulator for load test results"""
+    def __init__(self, reservoir_size=RESPONSE_TIME_RESERVOIR_SIZE):
+        self.total_requests = 0
+        self.successful_requests = 0
+        self.reservoir_size = reservoir_size
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._min = None
+        self._max = None
+        self._reservoir = []
+        
+    def add(self, result):
+        """Fold a single request result into the running totals"""
+        self.total_requests += 1
+        if not result['success']:
+            return
+        self.successful_requests += 1
+        
+        response_time = result['response_time']
+        if not response_time:
+            return
+        
+        # Welford's online update for mean and variance
+        self._count += 1
+        delta = response_time - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (response_time - self._mean)
+        self._min = response_time if self._min is None else min(self._min, response_time)
+        self._max = response_time if self._max is None else max(self._max, response_time)
+        
+        # Reservoir sampling keeps a uniform sample of every response time seen
+        if len(self._reservoir) < self.reservoir_size:
+            self._reservoir.append(response_time)
+        else:
+            slot = random.randrange(self._count)
+            if slot < self.reservoir_size:
+                self._reservoir[slot] = response_time
+    
+    def summary(self):
+        """Return request counts and response time statistics"""
+        failed_requests = self.total_requests - self.successful_requests
+        result = {
+            'total_requests': self.total_requests,
+            'successful_requests': self.successful_requests,
+            'failed_requests': failed_requests,
+            'success_rate': self.successful_requests / self.total_requests * 100 if self.total_requests else 0,
+            'avg_response_time': None,
+            'min_response_time': None,
+            'max_response_time': None,
+            'stdev_response_time': None,
+            'median_response_time': None,
+            'p95_response_time': None,
+            'p99_response_time': None
+        }
+        if not self._count:
+            return result
+        
+        # quantiles() sorts its input itself and needs two points, a single
+        # sample is its own percentile
+        if len(self._reservoir) > 1:
+            cuts = statistics.quantiles(self._reservoir, n=100, method='inclusive')
+        else:
+            cuts = self._reservoir * 99
+        result.update({
+            'avg_response_time': self._mean,
+            'min_response_time': self._min,
+            'max_response_time': self._max,
+            'stdev_response_time': (self._m2 / (self._count - 1)) ** 0.5 if self._count > 1 else 0.0,
+            'median_response_time': cuts[49],
+            'p95_response_time': cuts[94],
+            'p99_response_time': cuts[98]
+        })
+        return result
 
 class WebsitePerformanceTester:
-    def __init__(self):
+    def __init__(self, reuse_browser=False):
         self.results = {}
         self.browsers = ['chrome', 'firefox']
+        # Attach desktop Chrome drivers to one long-lived browser process
+        self.reuse_browser = reuse_browser
+        self._debugger_address = None
+        self._session = requests.Session()
+        self._driver_cache = {}
+        self._driver_lock = threading.Lock()
+        # Same-origin JSON endpoints seen during page loads, keyed by page URL
+        self._api_endpoints = {}
         
-    def setup_driver(self, browser='chrome', mobile=False):
+    def setup_driver(self, browser='chrome', mobile=False, block_resources=False, attach=True,
+                     capture_network=False):
         """Setup WebDriver for different browsers and devices"""
         if browser == 'chrome':
             options = ChromeOptions()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
+            if capture_network:
+                # Record network events so API calls made by the page can be discovered
+                options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            
+            debugger_address = self._shared_chrome_address() if self.reuse_browser and attach and not mobile else None
+            if debugger_address:
+                # Attach to the running browser, skipping process startup and keeping its cache
+                options.add_experimental_option('debuggerAddress', debugger_address)
+            else:
+                options.add_argument('--headless')
+                options.add_argument('--no-sandbox')
+                options.add_argument('--disable-dev-shm-usage')
             
             if mobile:
                 mobile_emulation = {"deviceName": "iPhone X"}
                 options.add_experimental_option("mobileEmulation", mobile_emulation)
                 
-            return webdriver.Chrome(options=options)
+            driver = webdriver.Chrome(options=options)
+            if block_resources:
+                self._set_resource_blocking(driver, True)
+            return driver
             
         elif browser == 'firefox':
             options = FirefoxOptions()
@@ -47,111 +180,364 @@ class WebsitePerformanceTester:
                     
             return webdriver.Firefox(options=options)
     
-    def measure_page_load_time(self, url, browser='chrome'):
-        """Measure detailed page load metrics"""
-        driver = self.setup_driver(browser)
+    def _shared_chrome_address(self):
+        """Return the DevTools address of the shared Chrome process, launching it on first use"""
+        if self._debugger_address is None:
+            # False records a failed launch so later drivers fall back without retrying
+            self._debugger_address = self._launch_chrome() or False
+        return self._debugger_address or None
+    
+    def _launch_chrome(self):
+        """Start a headless Chrome with remote debugging enabled and wait for it to accept connections"""
+        binary = next((path for path in map(shutil.which, CHROME_BINARIES) if path), None)
+        if binary is None:
+            return None
+        
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        profile_dir = tempfile.mkdtemp(prefix='perf-profile-')
+        process = subprocess.Popen(
+            [binary, '--headless=new', '--no-sandbox', '--disable-dev-shm-usage',
+             f'--remote-debugging-port={port}', f'--user-data-dir={profile_dir}', 'about:blank'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        # The browser outlives close_all() so later runs can attach to it again
+        atexit.register(_stop_chrome, process, profile_dir)
+        
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            try:
+                requests.get(f'http://127.0.0.1:{port}/json/version', timeout=1)
+                return f'127.0.0.1:{port}'
+            except requests.RequestException:
+                time.sleep(0.1)
+        
+        _stop_chrome(process, profile_dir)
+        return None
+    
+    def _set_resource_blocking(self, driver, enabled):
+        """Block or unblock image, font and stylesheet requests on a Chromium driver"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs',
+                               {'urls': BLOCKED_RESOURCE_PATTERNS if enabled else []})
+    
+    def _get_driver(self, browser='chrome', mobile=False, capture_network=False):
+        """Return a cached WebDriver for the browser/device pair, creating it on first use"""
+        # capture_network only applies when the driver is created; the load time
+        # measurement runs first, so it decides whether the shared desktop driver logs
+        key = (browser, mobile)
+        with self._driver_lock:
+            if key not in self._driver_cache:
+                self._driver_cache[key] = self.setup_driver(browser, mobile, capture_network=capture_network)
+            return self._driver_cache[key]
+    
+    def close_all(self):
+        """Quit every cached WebDriver"""
+        for driver in self._driver_cache.values():
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        self._driver_cache.clear()
+    
+    def measure_page_load_time(self, url, browser='chrome', runs=('cold', 'warm'), block_resources=False,
+                               min_runs=3, max_runs=10, accuracy=5, driver=None, discover_api=False):
+        """Measure detailed page load metrics for first-view (cold) and repeat-view (warm) loads"""
+        # Only API discovery pays for network event logging, and reading the log
+        # below drains it before later phases reuse this driver
+        driver = driver or self._get_driver(browser, capture_network=discover_api)
+        # Chromium drivers expose the DevTools protocol, other browsers fall back to JS timings only
+        supports_cdp = hasattr(driver, 'execute_cdp_cmd')
+        result = {'browser': browser}
+        
+        def measure_cold():
+            # Each cold sample gets a fresh browser, so the HTTP cache, DNS cache and
+            # idle sockets are all empty and every browser measures the same first view
+            cold_driver = self.setup_driver(browser, block_resources=block_resources, attach=False)
+            try:
+                if supports_cdp:
+                    cold_driver.execute_cdp_cmd('Performance.enable', {})
+                return self._measure_navigation(cold_driver, url, supports_cdp)
+            finally:
+                cold_driver.quit()
+        
+        def measure_warm():
+            return self._measure_navigation(driver, url, supports_cdp)
         
         try:
-            # Start timing
-            start_time = time.time()
+            if supports_cdp:
+                driver.execute_cdp_cmd('Performance.enable', {})
+                if block_resources:
+                    self._set_resource_blocking(driver, True)
             
-            # Navigate to page
-            driver.get(url)
-            
-            # Wait for page to be ready
-            WebDriverWait(driver, 30).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-            
-            end_time = time.time()
-            load_time = end_time - start_time
+            # Cold samples run in their own browsers, so the shared driver starts unprimed
+            primed = False
+            for run in runs:
+                if run == 'warm' and not primed:
+                    # Load the page once so the measured passes are repeat views
+                    driver.get(url)
+                
+                samples = self._sample_until_accurate(
+                    measure_cold if run == 'cold' else measure_warm, min_runs, max_runs, accuracy)
+                result[run] = self._summarize_samples(samples)
+                primed = primed or run == 'warm'
             
-            # Get performance metrics using JavaScript
-            performance_data = driver.execute_script("""
-                var perfData = performance.getEntriesByType('navigation')[0];
-                return {
-                    domContentLoaded: perfData.domContentLoadedEventEnd - perfData.navigationStart,
-                    loadComplete: perfData.loadEventEnd - perfData.navigationStart,
-                    firstPaint: performance.getEntriesByType('paint')[0] ? 
-                        performance.getEntriesByType('paint')[0].startTime : null,
-                    firstContentfulPaint: performance.getEntriesByType('paint')[1] ? 
-                        performance.getEntriesByType('paint')[1].startTime : null
-                };
-            """)
+            if supports_cdp and discover_api:
+                api_endpoint = self._find_api_endpoint(driver)
+                if api_endpoint:
+                    self._api_endpoints.setdefault(url, api_endpoint)
+                    result['api_endpoint'] = api_endpoint
             
-            return {
-                'total_load_time': load_time,
-                'dom_content_loaded': performance_data['domContentLoaded'] / 1000,
-                'load_complete': performance_data['loadComplete'] / 1000,
-                'first_paint': performance_data['firstPaint'] / 1000 if performance_data['firstPaint'] else None,
-                'first_contentful_paint': performance_data['firstContentfulPaint'] / 1000 if performance_data['firstContentfulPaint'] else None,
-                'browser': browser
-            }
+            return result
             
         except Exception as e:
             return {'error': str(e), 'browser': browser}
         finally:
-            driver.quit()
+            # The driver is shared with later phases, which need the full page
+            if supports_cdp and block_resources:
+                try:
+                    self._set_resource_blocking(driver, False)
+                except WebDriverException:
+                    pass
+    
+    def _sample_until_accurate(self, measure, min_runs, max_runs, accuracy):
+        """Repeat a measurement until the load time mean is within +/- accuracy percent at 95% confidence"""
+        samples = [measure() for _ in range(min_runs)]
+        while len(samples) < max_runs:
+            if len(samples) > 1:
+                times = [sample['total_load_time'] for sample in samples]
+                mean = statistics.fmean(times)
+                # Jain's sample size estimate: n = (100 * z * s / (r * mean))^2
+                needed = math.ceil((100 * 1.96 * statistics.stdev(times) / (accuracy * mean)) ** 2) if mean else 0
+                if len(samples) >= needed:
+                    break
+            samples.append(measure())
+        return samples
+    
+    def _summarize_samples(self, samples):
+        """Reduce repeated measurements to medians after dropping outliers beyond two standard deviations"""
+        times = [sample['total_load_time'] for sample in samples]
+        kept = samples
+        if len(samples) > 2:
+            mean = statistics.fmean(times)
+            stdev = statistics.stdev(times)
+            kept = [sample for sample in samples if abs(sample['total_load_time'] - mean) <= 2 * stdev]
+        
+        summary = {}
+        for key in ('total_load_time', 'dom_content_loaded', 'load_complete', 'first_paint', 'first_contentful_paint'):
+            values = [sample[key] for sample in kept if sample[key] is not None]
+            summary[key] = statistics.median(values) if values else None
+        
+        kept_times = [sample['total_load_time'] for sample in kept]
+        stdev = statistics.stdev(kept_times) if len(kept_times) > 1 else 0.0
+        summary.update({
+            'stdev': stdev,
+            'ci95': 1.96 * stdev / math.sqrt(len(kept_times)),
+            'n_samples': len(kept_times),
+            'outliers_dropped': len(samples) - len(kept)
+        })
+        
+        # DevTools counters are reported from the run closest to the median
+        representative = min(kept, key=lambda sample: abs(sample['total_load_time'] - summary['total_load_time']))
+        if 'browser_metrics' in representative:
+            summary['browser_metrics'] = representative['browser_metrics']
+        return summary
+    
+    def _measure_navigation(self, driver, url, supports_cdp):
+        """Navigate to the page once and collect its timing metrics"""
+        # Start timing
+        start_time = time.time()
+        
+        # Navigate to page, get() only returns once the load event has fired
+        driver.get(url)
+        
+        end_time = time.time()
+        load_time = end_time - start_time
+        
+        # Get performance metrics using JavaScript, navigation entries are relative to startTime
+        performance_data = driver.execute_script("""
+            var perfData = performance.getEntriesByType('navigation')[0];
+            var firstPaint = performance.getEntriesByName('first-paint')[0];
+            var firstContentfulPaint = performance.getEntriesByName('first-contentful-paint')[0];
+            return {
+                domContentLoaded: perfData.domContentLoadedEventEnd - perfData.startTime,
+                loadComplete: perfData.loadEventEnd - perfData.startTime,
+                firstPaint: firstPaint ? firstPaint.startTime : null,
+                firstContentfulPaint: firstContentfulPaint ? firstContentfulPaint.startTime : null
+            };
+        """)
+        
+        sample = {
+            'total_load_time': load_time,
+            'dom_content_loaded': performance_data['domContentLoaded'] / 1000,
+            'load_complete': performance_data['loadComplete'] / 1000,
+            'first_paint': performance_data['firstPaint'] / 1000 if performance_data['firstPaint'] else None,
+            'first_contentful_paint': performance_data['firstContentfulPaint'] / 1000 if performance_data['firstContentfulPaint'] else None
+        }
+        
+        # Browser-side counters such as JSHeapUsedSize, LayoutCount and ScriptDuration
+        if supports_cdp:
+            metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+            sample['browser_metrics'] = {metric['name']: metric['value'] for metric in metrics}
+        
+        return sample
+    
+    def _find_api_endpoint(self, driver):
+        """Return the first same-origin JSON endpoint the current page fetched with a plain GET, if any"""
+        origin = urlparse(driver.current_url).netloc
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException:
+            # Drivers passed in by the caller may not have network logging enabled
+            return None
+        
+        # Responses don't carry the request method, so pair them with their requests
+        requests_sent = {}
+        for entry in entries:
+            message = json.loads(entry['message'])['message']
+            params = message['params']
+            if message['method'] == 'Network.requestWillBeSent':
+                requests_sent[params['requestId']] = params['request']
+                continue
+            if message['method'] != 'Network.responseReceived':
+                continue
+            
+            # The load test replays the endpoint with bodiless GETs, so anything
+            # else (form posts, beacons, failed calls) would only measure errors
+            request = requests_sent.get(params['requestId'], {})
+            response = params['response']
+            if (params.get('type') in ('XHR', 'Fetch')
+                    and request.get('method') == 'GET'
+                    and not request.get('hasPostData')
+                    and response.get('status', 0) < 400
+                    and 'json' in response.get('mimeType', '')
+                    and urlparse(response['url']).netloc == origin):
+                return response['url']
+        return None
     
-    def check_broken_links(self, url, max_links=50):
+    def measure_load_times(self, url, browsers, block_resources=False, driver=None, discover_api=False):
+        """Measure page load metrics for each browser concurrently, using driver for Chrome if given"""
+        if not browsers:
+            return {}
+        
+        # Each browser runs in its own driver process, so the threads mostly
+        # wait on page rendering and their load times overlap
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(browsers)) as executor:
+            return dict(zip(browsers, executor.map(
+                lambda b: self.measure_page_load_time(url, b, block_resources=block_resources,
+                                                      driver=driver if b == 'chrome' else None,
+                                                      discover_api=discover_api),
+                browsers)))
+    
+    def check_broken_links(self, url, max_links=50, driver=None):
         """Check for broken links on the page"""
-        driver = self.setup_driver()
-        broken_links = []
+        driver = driver or self._get_driver()
         
         try:
             driver.get(url)
             
-            # Find all links
-            links = driver.find_elements(By.TAG_NAME, 'a')[:max_links]
+            # Read every link's target and text in one round-trip, then collect
+            # the unique targets so they can be checked concurrently
+            anchors = driver.execute_script("""
+                // SVG anchors expose href as an SVGAnimatedString, resolve its raw value
+                // against the document so every entry comes back as a plain string
+                return Array.from(document.querySelectorAll('a')).slice(0, arguments[0])
+                    .map(function(a) {
+                        var href = a.href;
+                        if (typeof href !== 'string') {
+                            href = (href && href.baseVal) || '';
+                            if (href) {
+                                try { href = new URL(href, document.baseURI).href; } catch (e) {}
+                            }
+                        }
+                        return [href, (a.innerText || a.textContent || '').slice(0, 50)];
+                    });
+            """, max_links)
+            links = {}
+            for href, text in anchors:
+                if href and href.startswith(('http://', 'https://')) and href not in links:
+                    links[href] = text
             
-            for link in links:
-                href = link.get_attribute('href')
-                if href and href.startswith(('http://', 'https://')):
-                    try:
-                        response = requests.head(href, timeout=10, allow_redirects=True)
-                        if response.status_code >= 400:
-                            broken_links.append({
-                                'url': href,
-                                'status_code': response.status_code,
-                                'text': link.text[:50]
-                            })
-                    except requests.RequestException:
-                        broken_links.append({
-                            'url': href,
-                            'status_code': 'timeout/error',
-                            'text': link.text[:50]
-                        })
+            return asyncio.run(self._check_links(links))
                         
         except Exception as e:
             return {'error': str(e)}
-        finally:
-            driver.quit()
-            
+    
+    async def _check_links(self, links):
+        """Check all link targets concurrently through one session with per-host limits"""
+        # Round-robin across hosts so no single server sees a burst of requests
+        groups = defaultdict(list)
+        hosts = {}
+        unparsable = []
+        for href in links:
+            try:
+                hosts[href] = urlparse(href).netloc
+            except ValueError:
+                # Malformed URLs (e.g. a broken IPv6 host) can never load, report them as broken
+                unparsable.append(href)
+                continue
+            groups[hosts[href]].append(href)
+        ordered = [href for batch in itertools.zip_longest(*groups.values()) for href in batch if href]
+        host_limits = {host: asyncio.Semaphore(LINK_CHECKS_PER_HOST) for host in groups}
+        
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=LINK_CHECKS_PER_HOST)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            statuses = await asyncio.gather(*(
+                self._check_link(session, href, host_limits[hosts[href]]) for href in ordered
+            ))
+        
+        broken_links = []
+        for href, status in [*zip(ordered, statuses), *((href, None) for href in unparsable)]:
+            if status is None or status >= 400:
+                broken_links.append({
+                    'url': href,
+                    'status_code': status if status is not None else 'timeout/error',
+                    'text': links[href]
+                })
         return broken_links
     
-    def test_mobile_responsiveness(self, url):
-        """Test mobile responsiveness and viewport handling"""
-        mobile_driver = self.setup_driver(mobile=True)
-        desktop_driver = self.setup_driver(mobile=False)
+    async def _check_link(self, session, href, host_limit):
+        """Return the HTTP status of a link, or None if it could not be reached"""
+        timeout = aiohttp.ClientTimeout(total=10)
+        try:
+            async with host_limit:
+                # A plain GET avoids servers that mishandle HEAD. Closing the response
+                # before the body is read means the body is never downloaded, at the
+                # cost of dropping the connection, so every check pays a fresh TCP/TLS handshake
+                async with session.get(href, allow_redirects=True, timeout=timeout,
+                                       headers={'User-Agent': LINK_CHECK_USER_AGENT}) as response:
+                    status = response.status
+                    response.close()
+                return status
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
+    
+    def test_mobile_responsiveness(self, url, driver=None):
+        """Test mobile responsiveness and viewport handling, using driver as the desktop browser if given"""
+        mobile_driver = self._get_driver(mobile=True)
+        desktop_driver = driver or self._get_driver(mobile=False)
         
         try:
-            # Test mobile version
+            # Test mobile version, collecting all indicators in one round-trip
             mobile_driver.get(url)
-            mobile_width = mobile_driver.execute_script("return window.innerWidth")
-            mobile_height = mobile_driver.execute_script("return window.innerHeight")
-            
-            # Check for mobile-specific elements
-            mobile_nav = len(mobile_driver.find_elements(By.CSS_SELECTOR, 
-                ".mobile-nav, .hamburger, .menu-toggle, [class*='mobile']"))
+            mobile_data = mobile_driver.execute_script("""
+                return {
+                    width: window.innerWidth,
+                    height: window.innerHeight,
+                    mobileNav: document.querySelectorAll(
+                        ".mobile-nav, .hamburger, .menu-toggle, [class*='mobile']").length,
+                    viewportMeta: document.querySelectorAll("meta[name='viewport']").length
+                };
+            """)
+            mobile_width = mobile_data['width']
+            mobile_height = mobile_data['height']
+            mobile_nav = mobile_data['mobileNav']
+            has_viewport_meta = mobile_data['viewportMeta'] > 0
             
             # Test desktop version
             desktop_driver.get(url)
             desktop_width = desktop_driver.execute_script("return window.innerWidth")
             
-            # Check responsive design indicators
-            has_viewport_meta = len(mobile_driver.find_elements(By.CSS_SELECTOR, 
-                "meta[name='viewport']")) > 0
-            
             # Calculate responsiveness score
             score = 70  # Base score
             if has_viewport_meta:
@@ -172,27 +558,31 @@ class WebsitePerformanceTester:
             
         except Exception as e:
             return {'error': str(e)}
-        finally:
-            mobile_driver.quit()
-            desktop_driver.quit()
     
-    def simulate_user_interactions(self, url):
+    def simulate_user_interactions(self, url, driver=None):
         """Simulate common user interactions and measure response times"""
-        driver = self.setup_driver()
+        driver = driver or self._get_driver()
         interactions = []
         
         try:
             driver.get(url)
             
-            # Test form interactions
-            forms = driver.find_elements(By.TAG_NAME, 'form')
-            for i, form in enumerate(forms[:3]):  # Test up to 3 forms
+            # Look up form inputs and buttons in a single round-trip
+            targets = driver.execute_script("""
+                return {
+                    formInputs: Array.from(document.forms).slice(0, 3)
+                        .map(function(form) { return form.querySelector('input'); }),
+                    buttons: Array.from(document.querySelectorAll('button')).slice(0, 5)
+                };
+            """)
+            
+            # Test form interactions (up to 3 forms)
+            for i, field in enumerate(targets['formInputs']):
                 try:
-                    inputs = form.find_elements(By.TAG_NAME, 'input')
-                    if inputs:
+                    if field is not None:
                         start_time = time.time()
-                        inputs[0].click()
-                        inputs[0].send_keys('test@example.com')
+                        field.click()
+                        field.send_keys('test@example.com')
                         end_time = time.time()
                         
                         interactions.append({
@@ -203,9 +593,8 @@ class WebsitePerformanceTester:
                 except Exception:
                     pass
             
-            # Test button clicks
-            buttons = driver.find_elements(By.TAG_NAME, 'button')
-            for i, button in enumerate(buttons[:5]):  # Test up to 5 buttons
+            # Test button clicks (up to 5 buttons)
+            for i, button in enumerate(targets['buttons']):
                 try:
                     if button.is_displayed() and button.is_enabled():
                         start_time = time.time()
@@ -223,17 +612,27 @@ class WebsitePerformanceTester:
                     
         except Exception as e:
             return {'error': str(e)}
-        finally:
-            driver.quit()
             
         return interactions
     
-    def load_test_simulation(self, url, concurrent_users=10, duration=30):
+    def load_test_simulation(self, url, concurrent_users=10, duration=30, prefer_api=True):
         """Simulate multiple concurrent users"""
+        # Hit the page's API directly when a browser run already discovered it,
+        # instead of re-rendering the HTML shell around it
+        target_url = self._api_endpoints.get(url, url) if prefer_api else url
+        
+        # Size the keep-alive pool to the worker count so sockets are reused
+        # across requests instead of paying a TCP/TLS handshake on every call.
+        # Closing the session first releases the previous run's pooled sockets
+        self._session.close()
+        adapter = HTTPAdapter(pool_maxsize=concurrent_users)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
         def single_user_test():
             start_time = time.time()
             try:
-                response = requests.get(url, timeout=30)
+                response = self._session.get(target_url, timeout=30)
                 end_time = time.time()
                 return {
                     'response_time': end_time - start_time,
@@ -248,33 +647,29 @@ class WebsitePerformanceTester:
                     'error': str(e)
                 }
         
-        results = []
-        start_time = time.time()
+        stats = LoadTestStats()
+        result_queue = queue.Queue(maxsize=concurrent_users * 2)
+        deadline = time.monotonic() + duration
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrent_users) as executor:
-            while time.time() - start_time < duration:
-                futures = [executor.submit(single_user_test) for _ in range(concurrent_users)]
-                
-                for future in concurrent.futures.as_completed(futures):
-                    results.append(future.result())
-                
-                time.sleep(1)  # Brief pause between batches
-        
-        # Analyze results
-        successful_requests = [r for r in results if r['success']]
-        failed_requests = [r for r in results if not r['success']]
-        response_times = [r['response_time'] for r in successful_requests if r['response_time']]
-        
-        return {
-            'total_requests': len(results),
-            'successful_requests': len(successful_requests),
-            'failed_requests': len(failed_requests),
-            'success_rate': len(successful_requests) / len(results) * 100 if results else 0,
-            'avg_response_time': statistics.mean(response_times) if response_times else None,
-            'min_response_time': min(response_times) if response_times else None,
-            'max_response_time': max(response_times) if response_times else None,
-            'median_response_time': statistics.median(response_times) if response_times else None
-        }
+        def user_loop():
+            # Each simulated user fires its next request as soon as the previous one completes
+            while time.monotonic() < deadline:
+                result_queue.put(single_user_test())
+        
+        # Plain long-lived threads, one per simulated user, report through the queue
+        users = [threading.Thread(target=user_loop, daemon=True) for _ in range(concurrent_users)]
+        for user in users:
+            user.start()
+        
+        # Results are folded into running statistics as they arrive, so memory
+        # stays bounded no matter how long the test runs
+        while any(user.is_alive() for user in users) or not result_queue.empty():
+            try:
+                stats.add(result_queue.get(timeout=0.1))
+            except queue.Empty:
+                pass
+        
+        return {'target_url': target_url, **stats.summary()}
     
     def run_comprehensive_test(self, url, config=None):
         """Run all tests and generate comprehensive report"""
@@ -285,6 +680,9 @@ class WebsitePerformanceTester:
                 'link_check': True,
                 'interaction_test': True,
                 'load_test': True,
+                'parallel': True,
+                'api_fast_path': True,
+                'block_resources': False,
                 'concurrent_users': 10,
                 'load_duration': 30
             }
@@ -296,36 +694,65 @@ class WebsitePerformanceTester:
             'config': config
         }
         
-        # Page load time tests
-        print("Testing page load times...")
-        load_times = {}
-        for browser in config['browsers']:
-            load_times[browser] = self.measure_page_load_time(url, browser)
-        results['load_times'] = load_times
-        
-        # Broken link check
+        # The remaining browser-driven phases are independent of each other
+        phases = []
         if config['link_check']:
-            print("Checking for broken links...")
-            results['broken_links'] = self.check_broken_links(url)
-        
-        # Mobile responsiveness
+            phases.append(('broken_links', 'check_broken_links', (url,), "Checking for broken links..."))
         if config['mobile_test']:
-            print("Testing mobile responsiveness...")
-            results['mobile_test'] = self.test_mobile_responsiveness(url)
-        
-        # User interaction simulation
+            phases.append(('mobile_test', 'test_mobile_responsiveness', (url,), "Testing mobile responsiveness..."))
         if config['interaction_test']:
-            print("Simulating user interactions...")
-            results['interactions'] = self.simulate_user_interactions(url)
-        
-        # Load testing
-        if config['load_test']:
-            print(f"Running load test with {config['concurrent_users']} concurrent users...")
-            results['load_test'] = self.load_test_simulation(
-                url, 
-                config['concurrent_users'], 
-                config['load_duration']
-            )
+            phases.append(('interactions', 'simulate_user_interactions', (url,), "Simulating user interactions..."))
+        
+        pool = None
+        try:
+            # Page load times are measured on their own first, so traffic and CPU
+            # load from the other phases do not skew them
+            print("Testing page load times...")
+            results['load_times'] = self.measure_load_times(
+                url, config['browsers'], config.get('block_resources', False),
+                discover_api=config.get('api_fast_path', True))
+            
+            if phases and config.get('parallel', True):
+                # Run phases side by side in threads, each checking out its own
+                # pre-warmed desktop Chrome from the pool
+                pool = DriverPool(self, len(phases))
+                
+                def run_pooled(method, args):
+                    with pool.checkout() as driver:
+                        return getattr(self, method)(*args, driver=driver)
+                
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(phases)) as executor:
+                    futures = {}
+                    for name, method, args, message in phases:
+                        print(message)
+                        futures[executor.submit(run_pooled, method, args)] = name
+                    
+                    for future in concurrent.futures.as_completed(futures):
+                        try:
+                            results[futures[future]] = future.result()
+                        except Exception as e:
+                            results[futures[future]] = {'error': str(e)}
+            else:
+                # Sequential phases share the cached drivers used for the load
+                # measurement, so the browser cache stays warm between phases
+                for name, method, args, message in phases:
+                    print(message)
+                    results[name] = getattr(self, method)(*args)
+            
+            # Load testing runs last so its traffic does not skew the
+            # browser measurements above
+            if config['load_test']:
+                print(f"Running load test with {config['concurrent_users']} concurrent users...")
+                results['load_test'] = self.load_test_simulation(
+                    url, 
+                    config['concurrent_users'], 
+                    config['load_duration'],
+                    config.get('api_fast_path', True)
+                )
+        finally:
+            if pool is not None:
+                pool.close()
+            self.close_all()
         
         # Generate summary score
         results['performance_score'] = self.calculate_performance_score(results)
@@ -340,16 +767,11 @@ class WebsitePerformanceTester:
         # Load time scoring
         load_times = results.get('load_times', {})
         for browser, data in load_times.items():
-            if 'total_load_time' in data:
-                load_time = data['total_load_time']
-                if load_time > 5:
-                    score -= 25
-                elif load_time > 3:
-                    score -= 15
-                elif load_time > 2:
-                    score -= 10
-                elif load_time > 1:
-                    score -= 5
+            # Score the first-view load, which is what new visitors experience
+            first_view = data.get('cold', data) if isinstance(data, dict) else {}
+            if 'total_load_time' in first_view:
+                load_time = first_view['total_load_time']
+                score -= LOAD_TIME_PENALTIES[bisect.bisect_left(LOAD_TIME_THRESHOLDS, load_time)]
         
         # Broken links penalty
         broken_links = results.get('broken_links', [])
@@ -360,10 +782,7 @@ class WebsitePerformanceTester:
         mobile_test = results.get('mobile_test', {})
         if 'responsiveness_score' in mobile_test:
             mobile_score = mobile_test['responsiveness_score']
-            if mobile_score < 70:
-                score -= 20
-            elif mobile_score < 85:
-                score -= 10
+            score -= MOBILE_SCORE_PENALTIES[bisect.bisect_right(MOBILE_SCORE_THRESHOLDS, mobile_score)]
         
         # Load test results
         load_test = results.get('load_test', {})
@@ -374,6 +793,64 @@ class WebsitePerformanceTester:
         
         return max(0, min(100, score))
 
+def _stop_chrome(process, profile_dir):
+    """Terminate a shared Chrome process and remove its temporary profile"""
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+    shutil.rmtree(profile_dir, ignore_errors=True)
+
+class DriverPool:
+    """Long-lived desktop Chrome drivers that test phases check out and return"""
+    def __init__(self, tester, size):
+        # Start every browser up front and in parallel, so checkouts never wait on a cold start
+        with concurrent.futures.ThreadPoolExecutor(max_workers=size) as executor:
+            futures = [executor.submit(tester.setup_driver, 'chrome', attach=False) for _ in range(size)]
+        
+        self._drivers = [future.result() for future in futures if future.exception() is None]
+        failures = [future.exception() for future in futures if future.exception() is not None]
+        if failures:
+            # Don't leave the browsers that did start running without an owner
+            self.close()
+            raise failures[0]
+        
+        self._available = queue.Queue()
+        for driver in self._drivers:
+            self._available.put(driver)
+    
+    def acquire(self):
+        """Take a driver out of the pool, waiting until one is free"""
+        return self._available.get()
+    
+    def release(self, driver):
+        """Reset per-checkout browser state and return the driver to the pool"""
+        try:
+            driver.get('about:blank')
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        except WebDriverException:
+            pass
+        self._available.put(driver)
+    
+    @contextmanager
+    def checkout(self):
+        """Borrow a driver for the duration of a with block"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+    
+    def close(self):
+        """Quit every driver owned by the pool"""
+        for driver in self._drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
 # Example usage
 if __name__ == "__main__":
     tester = WebsitePerformanceTester()
@@ -385,6 +862,9 @@ if __name__ == "__main__":
         'link_check': True,
         'interaction_test': True,
         'load_test': True,
+        'parallel': True,
+        'api_fast_path': True,
+        'block_resources': False,
         'concurrent_users': 25,
         'load_duration': 60
     }
@@ -393,9 +873,11 @@ if __name__ == "__main__":
     url = "https://example.com"  # Replace with actual URL
     results = tester.run_comprehensive_test(url, test_config)
     
-    # Save results
-    with open(f'performance_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    # Save results, naming the file after the run's own timestamp
+    stamp = datetime.fromisoformat(results['timestamp']).strftime('%Y%m%d_%H%M%S')
+    filename = f'performance_test_{stamp}.json'
+    with open(filename, 'w') as f:
+        json.dump(results, f)
     
     print(f"\nPerformance Score: {results['performance_score']}/100")
-    print(f"Results saved to performance_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    print(f"Results saved to {filename}")